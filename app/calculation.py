@@ -10,9 +10,18 @@ based, slot-optimised, and provides helpers for logging / CSV export.
 
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Sequence, Tuple
+from typing import ClassVar, Sequence, Tuple
+
+
+def _utc_timestamp(_strftime=time.strftime, _gmtime=time.gmtime) -> str:
+    """Return the current UTC time as ISO-8601 with seconds precision.
+
+    Equivalent to ``datetime.now(timezone.utc).isoformat(timespec="seconds")``
+    but without allocating a ``datetime`` for every memento.
+    """
+    return _strftime("%Y-%m-%dT%H:%M:%S+00:00", _gmtime())
 
 
 @dataclass(frozen=True, slots=True)
@@ -29,14 +38,39 @@ class CalculationMemento:
         The numeric outcome of the calculation.
     timestamp :
         ISO-8601 UTC time when the memento was created.
+
+    The CSV row returned by :meth:`as_row` is built once, when the memento
+    is created, and cached on the instance as the private ``_row`` field.
+    It is excluded from ``repr`` and comparisons, but ``dataclasses.fields``,
+    ``asdict`` and ``astuple`` do include it; use :meth:`as_dict` for the
+    five public columns.
     """
 
+    #: Column order shared by :meth:`as_dict`, :meth:`as_row` and CSV files.
+    CSV_HEADER: ClassVar[Tuple[str, ...]] = (
+        "timestamp", "operation", "op1", "op2", "result",
+    )
+
     operation_name: str
     operands: Tuple[float, float]
     result: float
-    timestamp: str = field(
-        default_factory=lambda: datetime.now(timezone.utc).isoformat(timespec="seconds")
-    )
+    timestamp: str = field(default_factory=_utc_timestamp)
+
+    # Cached CSV row, filled in __post_init__ (frozen, so via object.__setattr__).
+    _row: tuple = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "_row",
+            (
+                self.timestamp,
+                self.operation_name,
+                self.operands[0],
+                self.operands[1],
+                self.result,
+            ),
+        )
 
     # --------------------------------------------------------------------- #
     # Public helpers                                                         #
@@ -44,13 +78,11 @@ class CalculationMemento:
 
     def as_dict(self) -> dict[str, str | float]:
         """Return the memento as a flat dict ready for CSV / JSON logging."""
-        return {
-            "timestamp": self.timestamp,
-            "operation": self.operation_name,
-            "op1": self.operands[0],
-            "op2": self.operands[1],
-            "result": self.result,
-        }
+        return dict(zip(self.CSV_HEADER, self._row))
+
+    def as_row(self) -> tuple[str, str, float, float, float]:
+        """Return the memento as a tuple in :attr:`CSV_HEADER` order."""
+        return self._row
 
     # Factory constructor -------------------------------------------------- #
 
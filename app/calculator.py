@@ -4,7 +4,8 @@ calculator.py
 
 High-level façade that coordinates:
 
-* Operation resolution (via :class:`app.operations.OperationFactory`)
+* Operation resolution (via per-operation evaluators built from
+  :data:`app.operations.OPS`)
 * Result persistence in :class:`app.history.History`
 * Undo / redo functionality
 * Observer notifications (logging, auto-save, …)
@@ -12,11 +13,11 @@ High-level façade that coordinates:
 
 from __future__ import annotations
 
-from typing import List, Sequence, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from app.calculation import CalculationMemento
 from app.history import History
-from app.operations import OperationFactory
+from app.operations import OPS, resolve_name
 from app.observers import Observer
 
 
@@ -33,7 +34,13 @@ class Calculator:
         self._history: History[CalculationMemento] = History(
             max_size=max_history or self.DEFAULT_MAX_HISTORY
         )
-        self._observers: List[Observer] = []
+        # Copy-on-write tuple: (un)registering rebinds it, so notification
+        # loops never see the sequence change under them.
+        self._observers: Tuple[Observer, ...] = ()
+        # keyword → specialised evaluator (see _make_evaluator)
+        self._dispatch: Dict[str, Callable[[float, float], float]] = {
+            name: self._make_evaluator(name, fn) for name, fn in OPS.items()
+        }
 
     # ──────────────────────────────────────────────────────────────── #
     # Observer management                                             #
@@ -41,14 +48,13 @@ class Calculator:
 
     def register_observer(self, observer: Observer) -> None:
         """Add an observer that will receive every new memento."""
-        self._observers.append(observer)
+        self._observers += (observer,)
 
     def unregister_observer(self, observer: Observer) -> None:
         """Remove a previously registered observer (no-op if absent)."""
-        try:    # pragma: no cover
-            self._observers.remove(observer)    # pragma: no cover
-        except ValueError:  # pragma: no cover
-            pass  # silent fail is fine for idempotency # pragma: no cover
+        self._observers = tuple(  # pragma: no cover
+            obs for obs in self._observers if obs is not observer
+        )
 
     def _notify_observers(self, memento: CalculationMemento) -> None:
         """Notify all observers *safely* (one failing observer won’t stop others)."""
@@ -60,18 +66,85 @@ class Calculator:
                 # doesn’t crash the calculator.  In production we might log this.
                 pass
 
+    def _notify_many(self, mementos: Sequence[CalculationMemento]) -> None:
+        """Deliver a batch of mementos with one call per observer.
+
+        Observers that implement ``notify_many`` get the whole batch at once;
+        anything else falls back to one :meth:`~Observer.notify` per memento.
+        """
+        for obs in self._observers:
+            try:
+                notify_many = getattr(obs, "notify_many", None)
+                if notify_many is not None:
+                    notify_many(mementos)
+                else:
+                    for m in mementos:
+                        obs.notify(m)
+            except Exception:  # pragma: no cover
+                pass
+
     # ──────────────────────────────────────────────────────────────── #
     # Core API                                                        #
     # ──────────────────────────────────────────────────────────────── #
 
     def evaluate(self, op_name: str, *operands: float) -> float:
-        op_obj = OperationFactory.create(op_name, *operands)
-        result = op_obj.evaluate()
-
-        memento = CalculationMemento.from_operation(op_obj)
-        self._history.push(memento)
-        self._notify_observers(memento)
-        return result
+        try:
+            evaluator = self._dispatch[op_name]
+        except KeyError:
+            evaluator = self._dispatch[resolve_name(op_name)]
+        if len(operands) != 2:
+            raise ValueError(
+                f"{op_name.lower()} expects 2 arguments, got {len(operands)}"
+            )
+        return evaluator(*operands)
+
+    def evaluate_many(
+        self, calls: Iterable[Tuple[str, float, float]]
+    ) -> List[float]:
+        """Evaluate ``(op_name, a, b)`` triples as one batch; return the results.
+
+        Every call is computed before anything is recorded, so if one raises
+        the history is untouched and no observer fires.  Observers then get
+        the whole batch in a single ``notify_many`` call each.
+        """
+        mementos: List[CalculationMemento] = []
+        append, Memento = mementos.append, CalculationMemento
+        for op_name, a, b in calls:
+            name = op_name if op_name in OPS else resolve_name(op_name)
+            append(Memento(name, (a, b), OPS[name](a, b)))
+
+        push = self._history.push
+        for m in mementos:
+            push(m)
+        self._notify_many(mementos)
+        return [m.result for m in mementos]
+
+    def _make_evaluator(
+        self, name: str, fn: Callable[[float, float], float]
+    ) -> Callable[[float, float], float]:
+        """Return a closure that evaluates *fn* and records the result.
+
+        Everything the hot path touches — the math function, the keyword,
+        ``History.push`` and the notifier — is bound as a default argument,
+        so a call does no attribute or global lookups and creates no
+        `Operation` instance.
+        """
+        def _evaluate(
+            a: float,
+            b: float,
+            _fn=fn,
+            _name=name,
+            _Memento=CalculationMemento,
+            _push=self._history.push,
+            _notify=self._notify_observers,
+        ) -> float:
+            result = _fn(a, b)
+            memento = _Memento(_name, (a, b), result)
+            _push(memento)
+            _notify(memento)
+            return result
+
+        return _evaluate
 
     # ──────────────────────────────────────────────────────────────── #
     # History helpers (unchanged)                                     #
@@ -86,9 +159,30 @@ class Calculator:
     def clear_history(self) -> None:
         self._history.clear()
 
-    def history(self) -> Tuple[CalculationMemento, ...]:
-        past, _ = self._history.snapshot()
-        return tuple(past)
+    def peek(self) -> CalculationMemento:
+        """Return the latest calculation (``IndexError`` if there is none).
+
+        O(1): unlike :meth:`history_tuple` nothing is copied, and unlike
+        indexing :meth:`history` no view object is created.
+        """
+        return self._history.peek()
+
+    def history(self) -> Sequence[CalculationMemento]:
+        """Return a live, read-only view of the undo-able calculations.
+
+        Oldest first.  No copy is made, so do not mutate the result; use
+        :meth:`history_tuple` if you need a snapshot that outlives later
+        calculations.
+        """
+        return self._history.past_view()
+
+    def history_tuple(self) -> Tuple[CalculationMemento, ...]:
+        """Return an immutable snapshot of :meth:`history`."""
+        return tuple(self._history.past_view())
+
+    def iter_history(self) -> Iterator[CalculationMemento]:
+        """Iterate over :meth:`history` (oldest first)."""
+        return iter(self._history.past_view())
 
     # ──────────────────────────────────────────────────────────────── #
     # Convenience                                                     #
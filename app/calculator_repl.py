@@ -21,22 +21,34 @@ exit / quit – leave the program gracefully
 from __future__ import annotations
 
 import csv
+import io
 import shlex
 import sys
+from contextlib import redirect_stdout
 from pathlib import Path
-from typing import Callable, Sequence
+from typing import Callable, Iterable, Iterator, Sequence
 
-try:
-    from colorama import Fore, Style, init as colorama_init
-except ImportError:  # pragma: no cover
-    # colour is optional; degrade gracefully
-    class _NoColor:
-        def __getattr__(self, item):  # noqa: D401
-            return ""
 
-    Fore = Style = _NoColor()
-    def colorama_init(*_a, **_kw):  # type: ignore
-        pass
+class _NoColor:
+    """Stand-in for colorama's ``Fore``/``Style``: every attribute is ``""``."""
+
+    def __getattr__(self, item):  # noqa: D401
+        return ""
+
+
+# Plain until _init_color() runs, so importing this module (tests, scripts)
+# never pays for colorama.
+Fore = Style = _NoColor()
+
+
+def _init_color() -> None:
+    """Import and initialise colorama; colour is optional, so degrade gracefully."""
+    global Fore, Style
+    try:
+        from colorama import Fore, Style, init as colorama_init
+    except ImportError:  # pragma: no cover
+        return
+    colorama_init(autoreset=True)
 
 
 from app.calculator import Calculator
@@ -44,8 +56,11 @@ from app.calculation import CalculationMemento
 from app.observers import LoggingObserver, AutoSaveObserver
 
 
-_PROMPT = f"{Fore.GREEN}calc> {Style.RESET_ALL}"
 _HELP_TEXT = __doc__.split("Supported commands")[1].strip()
+# Commands whose argument is a path: tokenised with shlex to honour quotes.
+_PATH_COMMANDS = frozenset({"save", "load"})
+# Characters that force a CSV field to be quoted.
+_CSV_SPECIAL = (",", '"', "\n", "\r")
 
 
 class CalculatorCLI:
@@ -58,7 +73,7 @@ class CalculatorCLI:
             LoggingObserver(Path("logs") / "calculator.log")
         )
         self.calc.register_observer(
-            AutoSaveObserver(Path("history") / "history.csv", self.calc.history)
+            AutoSaveObserver(Path("history") / "history.csv")
         )
         self._cmd_map: dict[str, Callable[[Sequence[str]], None]] = {
             "undo": self._cmd_undo,
@@ -78,8 +93,9 @@ class CalculatorCLI:
 
     def run(self) -> None:
         """Start the readline loop until user exits."""
-        colorama_init(autoreset=True)
-        
+        _init_color()
+        prompt = f"{Fore.GREEN}calc> {Style.RESET_ALL}"
+
         banner = (
             f"{Fore.CYAN}\n"
             "╔═════════════════════════════════════════════════╗\n"
@@ -89,26 +105,70 @@ class CalculatorCLI:
             "Type 'help' to list commands – Ctrl-D or 'exit' to quit.\n"
         )
         print(banner)
+        read_line = self._make_reader(prompt)
         try:
             while True:
-                try:
-                    line = input(_PROMPT)
-                except EOFError:
+                line = read_line()
+                if line is None:
                     print()  # newline after Ctrl-D
                     break
                 self._handle_line(line.strip())
         except KeyboardInterrupt:
             print("\nInterrupted by user.")
 
+    @staticmethod
+    def _make_reader(prompt: str) -> Callable[[], str | None]:
+        """Return a function that shows *prompt* and reads one line (None on EOF).
+
+        A terminal gets ``input()`` for line editing and history.  Piped
+        input skips the readline machinery: the prompt is written and the
+        line read straight from the already-bound stream methods.
+        """
+        if sys.stdin.isatty():
+            def read_tty() -> str | None:
+                try:
+                    return input(prompt)
+                except EOFError:
+                    return None
+
+            return read_tty
+
+        write, flush, readline = sys.stdout.write, sys.stdout.flush, sys.stdin.readline
+
+        def read_pipe() -> str | None:
+            write(prompt)
+            flush()
+            return readline() or None
+
+        return read_pipe
+
     # ------------------------------------------------------------------ #
     # Command dispatcher                                                 #
     # ------------------------------------------------------------------ #
 
+    def _handle_lines(self, lines: Iterable[str]) -> None:
+        """Run several command lines, emitting all their output in one write.
+
+        Output is collected in memory and written once at the end — also
+        when a command such as ``exit`` stops the batch early.
+        """
+        out = sys.stdout
+        buf = io.StringIO()
+        try:
+            with redirect_stdout(buf):
+                for line in lines:
+                    self._handle_line(line.strip())
+        finally:
+            out.write(buf.getvalue())
+
     def _handle_line(self, line: str) -> None:
         if not line:
             return
-        parts = shlex.split(line.lower())
-        cmd, *args = parts
+        cmd, *args = line.split()
+        cmd = cmd.lower()
+        if cmd in _PATH_COMMANDS:
+            # file names may be quoted and are case-sensitive
+            args = shlex.split(line)[1:]
 
         # built-in commands
         if cmd in self._cmd_map:
@@ -117,10 +177,10 @@ class CalculatorCLI:
 
         # calculation commands
         try:
-            operands = [float(a) for a in args]
-            if len(operands) != 2:
+            if len(args) != 2:
                 raise ValueError("need exactly two numeric operands")
-            result = self.calc.evaluate(cmd, *operands)
+            a, b = args
+            result = self.calc.evaluate(cmd, float(a), float(b))
             print(Fore.YELLOW + f"= {result}" + Style.RESET_ALL)
         except Exception as exc:
             print(Fore.RED + f"Error: {exc}" + Style.RESET_ALL)
@@ -144,10 +204,11 @@ class CalculatorCLI:
             print("Nothing to redo.")
 
     def _cmd_history(self, _args) -> None:
-        if not self.calc.history():
+        hist = self.calc.history()
+        if not hist:
             print("History is empty.")
             return
-        for idx, m in enumerate(self.calc.history(), 1):
+        for idx, m in enumerate(hist, 1):
             print(f"{idx:>3}: {self._fmt_memento(m)}")
 
     def _cmd_clear(self, _args) -> None:
@@ -158,12 +219,31 @@ class CalculatorCLI:
         if not args:
             print("Usage: save <file>")
             return
+        hist = self.calc.history()
+        if not hist:
+            print("Nothing to save.")
+            return
         dest = Path(args[0])
         dest.parent.mkdir(parents=True, exist_ok=True)
-        with dest.open("w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=list(self.calc.history()[0].as_dict()))
-            writer.writeheader()
-            writer.writerows(m.as_dict() for m in self.calc.history())
+        rows = [m.as_row() for m in hist]
+        # Numbers never need quoting; the text fields normally don't either
+        # (ISO timestamps, registry keywords), but a loaded file may carry
+        # anything, so check them and only then take the fast path.
+        if any(
+            ch in text
+            for ts, op, *_ in rows
+            for text in (ts, op)
+            for ch in _CSV_SPECIAL
+        ):
+            with dest.open("w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f, lineterminator="\n")
+                writer.writerow(CalculationMemento.CSV_HEADER)
+                writer.writerows(rows)
+        else:
+            # plain fields: format the whole file in one pass, one write
+            header = ",".join(CalculationMemento.CSV_HEADER)
+            body = "".join(f"{ts},{op},{a},{b},{r}\n" for ts, op, a, b, r in rows)
+            dest.write_text(f"{header}\n{body}", encoding="utf-8")
         print(f"History saved to {dest}")
 
     def _cmd_load(self, args) -> None:
@@ -174,18 +254,36 @@ class CalculatorCLI:
         if not src.exists():
             print("File not found.")
             return
-        with src.open() as f:
-            reader = csv.DictReader(f)
-            self.calc.clear_history()
-            for row in reader:
-                m = CalculationMemento(
-                    operation_name=row["operation"].lower(),
-                    operands=(float(row["op1"]), float(row["op2"])),
-                    result=float(row["result"]),
-                    timestamp=row["timestamp"],
-                )
-                # push directly so observers don't fire
-                self.calc._history.push(m)  # type: ignore[attr-defined]
+        Memento = CalculationMemento
+        text = src.read_text(encoding="utf-8")
+        rows: Iterator[Sequence[str]]
+        if '"' in text:
+            # quoted fields (e.g. a hand-edited file): needs the real parser
+            rows = (row for row in csv.reader(io.StringIO(text)) if row)
+        else:
+            # our own writer never quotes, so a plain split is enough
+            rows = (line.split(",", 4) for line in text.splitlines() if line)
+        header = next(rows, None)
+        if header is not None and tuple(header) != Memento.CSV_HEADER:
+            # columns in another order (or extra ones): map them by name
+            rows = (
+                tuple(row[name] for name in Memento.CSV_HEADER)
+                for row in csv.DictReader(io.StringIO(text))
+            )
+        # Parse everything first so a bad row leaves the history untouched.
+        try:
+            loaded = [
+                Memento(op.lower(), (float(a), float(b)), float(r), ts)
+                for ts, op, a, b, r in rows
+            ]
+        except (KeyError, ValueError) as exc:
+            print(Fore.RED + f"Error: cannot load {src}: {exc}" + Style.RESET_ALL)
+            return
+        self.calc.clear_history()
+        # Rows are pushed straight onto the history so observers don't fire.
+        push = self.calc._history.push  # type: ignore[attr-defined]
+        for m in loaded:
+            push(m)
         print(f"History loaded from {src}")
 
     def _cmd_help(self, _args) -> None:
@@ -9,24 +9,39 @@ Implements:
     • clear()
     • __len__ and __bool__
 
-Design: two deques (“past” and “future”) give O(1) push/undo/redo.
+Design: a single ring buffer holds both the undo and the redo entries.
+``_head`` is the slot of the oldest entry, ``_cursor`` counts the entries
+that can be undone and ``_size`` counts all live entries, so the redo
+stack is simply the slots between ``_cursor`` and ``_size``.  push / undo /
+redo are O(1) index updates — nothing is moved between containers.
 """
 
 from __future__ import annotations
 
-from collections import deque
-from typing import Deque, Generic, Iterable, TypeVar
+from itertools import chain, islice
+from typing import Generic, Iterable, Iterator, List, Sequence, TypeVar, overload
 
 T = TypeVar("T")
 
 
 class History(Generic[T]):
-    """Undo/redo stack using two internal deques."""
+    """Undo/redo stack backed by one fixed-capacity ring buffer.
+
+    With ``max_size=None`` the buffer simply grows and never wraps.
+    """
 
     def __init__(self, max_size: int | None = None) -> None:
-        # Older items on the *left*, newest on the *right*.
-        self._past: Deque[T] = deque(maxlen=max_size)
-        self._future: Deque[T] = deque(maxlen=max_size)
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be a positive integer or None")
+        self._max_size = max_size
+        self._buf: List[T] = [None] * max_size if max_size else []  # type: ignore[list-item]
+        self._head = 0      # physical index of the oldest entry
+        self._cursor = 0    # entries that can be undone
+        self._size = 0      # live entries (undo + redo)
+
+    def _slot(self, i: int) -> int:
+        """Physical buffer index of logical position *i* (0 = oldest)."""
+        return (self._head + i) % len(self._buf)
 
     # ────────────────────────────────────────────────────────────
     # Core API
@@ -34,41 +49,121 @@ class History(Generic[T]):
 
     def push(self, item: T) -> None:
         """Record a new memento and clear the redo stack."""
-        self._past.append(item)
-        self._future.clear()
+        buf = self._buf
+        if self._cursor < len(buf):
+            # free slot (or a stale redo entry) right after the cursor
+            buf[(self._head + self._cursor) % len(buf)] = item
+            self._cursor += 1
+        elif self._max_size is None:
+            buf.append(item)
+            self._cursor += 1
+        else:
+            # full: overwrite the oldest entry and advance the head
+            buf[self._head] = item
+            self._head = (self._head + 1) % len(buf)
+        self._size = self._cursor
 
     def undo(self) -> T:
-        """Pop the most-recent item and move it to the redo stack."""
-        if not self._past:
+        """Step the cursor back and return the entry it passed over."""
+        if not self._cursor:
             raise IndexError("nothing to undo")
-        item = self._past.pop()
-        self._future.append(item)
-        return item
+        self._cursor -= 1
+        return self._buf[self._slot(self._cursor)]
 
     def redo(self) -> T:
         """Re-apply the last undone item."""
-        if not self._future:
+        if self._cursor == self._size:
             raise IndexError("nothing to redo")
-        item = self._future.pop()
-        self._past.append(item)
+        item = self._buf[self._slot(self._cursor)]
+        self._cursor += 1
         return item
 
+    def peek(self) -> T:
+        """Return the most recent undo-able entry without removing it."""
+        if not self._cursor:
+            raise IndexError("history is empty")
+        return self._buf[self._slot(self._cursor - 1)]
+
     def clear(self) -> None:
         """Erase both stacks."""
-        self._past.clear()
-        self._future.clear()
+        # Drop references so cleared mementos can be garbage-collected.
+        self._buf = [None] * self._max_size if self._max_size else []  # type: ignore[list-item]
+        self._head = self._cursor = self._size = 0
 
     # ────────────────────────────────────────────────────────────
     # Dunder helpers
     # ────────────────────────────────────────────────────────────
 
     def __len__(self) -> int:
-        return len(self._past)
+        return self._cursor
 
     def __bool__(self) -> bool:  # pragma: no cover
-        return bool(self._past)
+        return bool(self._cursor)
+
+    # ────────────────────────────────────────────────────────────
+    # Read-only views
+    # ────────────────────────────────────────────────────────────
+
+    def past_view(self) -> Sequence[T]:
+        """Return the undo stack (oldest first) without copying it.
+
+        The returned object is live and owned by the history: iterate or
+        index it, but never mutate it.
+        """
+        return _RingView(self, future=False)
+
+    def future_view(self) -> Sequence[T]:
+        """Return the redo stack, next-to-redo first (same contract as above)."""
+        return _RingView(self, future=True)
 
     # Convenience for debugging/tests
     def snapshot(self) -> tuple[Iterable[T], Iterable[T]]:  # pragma: no cover
         """Return (past, future) as two immutable tuples."""
-        return tuple(self._past), tuple(self._future)
+        return tuple(self.past_view()), tuple(self.future_view())
+
+
+class _RingView(Sequence[T]):
+    """Live window over the past or future part of a :class:`History`."""
+
+    __slots__ = ("_history", "_future")
+
+    def __init__(self, history: History[T], future: bool) -> None:
+        self._history = history
+        self._future = future
+
+    def _bounds(self) -> tuple[int, int]:
+        h = self._history
+        return (h._cursor, h._size) if self._future else (0, h._cursor)
+
+    def __len__(self) -> int:
+        start, stop = self._bounds()
+        return stop - start
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        start, stop = self._bounds()
+        n = stop - start
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("history index out of range")
+        h = self._history
+        return h._buf[h._slot(start + index)]
+
+    def __iter__(self) -> Iterator[T]:
+        start, stop = self._bounds()
+        if start == stop:
+            return iter(())
+        h = self._history
+        first, cap = h._slot(start), len(h._buf)
+        last = first + (stop - start)
+        if last <= cap:
+            return islice(h._buf, first, last)
+        # window wraps past the end of the buffer
+        return chain(islice(h._buf, first, cap), islice(h._buf, 0, last - cap))
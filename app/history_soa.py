@@ -0,0 +1,101 @@
+"""
+history_soa.py
+==============
+
+Defines :class:`HistorySoA`, a column-oriented store for long calculator
+histories that are analysed rather than undone.  Each memento field lives
+in its own compact ``array`` and mementos are only materialised on access.
+Unlike the generic :class:`app.history.History`, it knows the memento
+layout and the operation registry.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator, List, Sequence, overload
+
+from app.calculation import CalculationMemento
+from app.operations import OPS
+
+# Operation keyword ↔ one-byte id stored in ``HistorySoA.op_ids``.
+_OP_NAMES: tuple[str, ...] = tuple(OPS)
+_OP_IDS: dict[str, int] = {name: i for i, name in enumerate(_OP_NAMES)}
+
+
+class HistorySoA:
+    """Append-only history stored as parallel columns (struct of arrays).
+
+    Operation names are kept as one-byte ids and numbers as C doubles, so an
+    entry costs 25 bytes of column data (1 + 3 × 8) plus a list slot for its
+    timestamp string, instead of a full memento object.  Columns are public
+    for bulk work, e.g. ``sum(h.results)``; indexing, slicing or iterating
+    builds mementos on demand (numbers come back as ``float``).
+    """
+
+    __slots__ = ("op_ids", "op1", "op2", "results", "timestamps")
+
+    def __init__(self, mementos: Iterable[CalculationMemento] = ()) -> None:
+        self.op_ids = array("B")
+        self.op1 = array("d")
+        self.op2 = array("d")
+        self.results = array("d")
+        self.timestamps: List[str] = []
+        self.extend(mementos)
+
+    def push(self, memento: CalculationMemento) -> None:
+        """Append one memento; its operation must be a known keyword."""
+        try:
+            op_id = _OP_IDS[memento.operation_name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown operation '{memento.operation_name}'"
+            ) from None
+        self.op_ids.append(op_id)
+        self.op1.append(memento.operands[0])
+        self.op2.append(memento.operands[1])
+        self.results.append(memento.result)
+        self.timestamps.append(memento.timestamp)
+
+    def extend(self, mementos: Iterable[CalculationMemento]) -> None:
+        """Append every memento in *mementos*, in order."""
+        push = self.push
+        for memento in mementos:
+            push(memento)
+
+    def clear(self) -> None:
+        """Empty every column."""
+        for column in (self.op_ids, self.op1, self.op2, self.results, self.timestamps):
+            del column[:]
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    @overload
+    def __getitem__(self, index: int) -> CalculationMemento: ...
+    @overload
+    def __getitem__(self, index: slice) -> List[CalculationMemento]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [
+                CalculationMemento(_OP_NAMES[op_id], (a, b), r, ts)
+                for op_id, a, b, r, ts in zip(
+                    self.op_ids[index], self.op1[index], self.op2[index],
+                    self.results[index], self.timestamps[index],
+                )
+            ]
+        return CalculationMemento(
+            _OP_NAMES[self.op_ids[index]],
+            (self.op1[index], self.op2[index]),
+            self.results[index],
+            self.timestamps[index],
+        )
+
+    def __iter__(self) -> Iterator[CalculationMemento]:
+        for op_id, a, b, r, ts in zip(
+            self.op_ids, self.op1, self.op2, self.results, self.timestamps
+        ):
+            yield CalculationMemento(_OP_NAMES[op_id], (a, b), r, ts)
+
+
+__all__: Sequence[str] = ["HistorySoA"]
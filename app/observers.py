@@ -9,9 +9,9 @@ Classes
 Observer :
     Abstract base with a single :meth:`notify` method.
 LoggingObserver :
-    Logs a one-line summary of every calculation to a rotating file.
+    Appends a one-line summary of every calculation to a text log.
 AutoSaveObserver :
-    Writes the entire history stack to a CSV using *pandas*.
+    Appends new calculations to a CSV file in small, batched writes.
 
 The module is self-contained; concrete observers can be registered with
 :py:meth:`app.calculator.Calculator.register_observer`.
@@ -19,12 +19,13 @@ The module is self-contained; concrete observers can be registered with
 
 from __future__ import annotations
 
-import logging
+import atexit
+import csv
+import threading
 from abc import ABC, abstractmethod
+from collections import deque
 from pathlib import Path
-from typing import Sequence
-
-import pandas as pd
+from typing import Deque, Iterable, Sequence
 
 from app.calculation import CalculationMemento
 
@@ -36,17 +37,29 @@ from app.calculation import CalculationMemento
 class Observer(ABC):
     """Interface for post-calculation observers."""
 
+    __slots__ = ()
+
     @abstractmethod
     def notify(self, memento: CalculationMemento) -> None:
         """React to a **newly created** memento."""
 
+    def notify_many(self, mementos: Iterable[CalculationMemento]) -> None:
+        """React to several new mementos; override to handle them in bulk."""
+        for memento in mementos:
+            self.notify(memento)
+
 
 # --------------------------------------------------------------------------- #
 # Concrete observers                                                          #
 # --------------------------------------------------------------------------- #
 
 class LoggingObserver(Observer):
-    """Append each calculation to a rotating text log.
+    """Append each calculation as one line of a plain-text log.
+
+    Lines look like ``<timestamp> - ADD 2, 3 = 5`` and reuse the memento's
+    own timestamp, so no clock is read and no ``logging`` machinery runs
+    per calculation.  The file stays open until :meth:`close`, which also
+    runs when the interpreter exits.
 
     Parameters
     ----------
@@ -54,52 +67,155 @@ class LoggingObserver(Observer):
         Path to the log file (will be created if absent).
     """
 
-    def __init__(self, log_path: Path) -> None:
-        self._logger = logging.getLogger("CalculatorLogger")
-        self._logger.setLevel(logging.INFO)
+    __slots__ = ("_file",)
 
+    def __init__(self, log_path: Path) -> None:
         # Ensure parent directory exists
         log_path.parent.mkdir(parents=True, exist_ok=True)
 
-        handler = logging.FileHandler(log_path, encoding="utf-8")
-        formatter = logging.Formatter(
-            "%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-        )
-        handler.setFormatter(formatter)
-        self._logger.addHandler(handler)
+        # Line-buffered: each entry reaches the file as soon as it is written.
+        self._file = log_path.open("a", encoding="utf-8", buffering=1)
+        atexit.register(self.close)
 
     def notify(self, memento: CalculationMemento) -> None:  # noqa: D401
-        msg = (
-            f"{memento.operation_name.upper()} "
-            f"{memento.operands[0]}, {memento.operands[1]} = {memento.result}"
+        if self._file.closed:
+            return
+        self._file.write(
+            f"{memento.timestamp} - {memento.operation_name.upper()} "
+            f"{memento.operands[0]}, {memento.operands[1]} = {memento.result}\n"
         )
-        self._logger.info(msg)
+
+    def close(self) -> None:
+        """Close the log file.
+
+        Safe to call more than once; calculations received afterwards are
+        ignored.
+        """
+        if self._file.closed:
+            return
+        self._file.close()
+        atexit.unregister(self.close)
 
 
 class AutoSaveObserver(Observer):
-    """Write the entire history to CSV after every calculation."""
+    """Append every calculation to a CSV file in coalesced batches.
+
+    Only newly received mementos are written, so the cost per calculation
+    is one row regardless of how long the history has grown.  Rows are
+    buffered and written together once *batch_size* of them are pending or
+    *flush_interval* seconds after the first one arrived, whichever comes
+    first; passing ``None`` for either disables that trigger, and with both
+    disabled rows are only written by an explicit :meth:`flush`.  Anything
+    still pending is flushed, and the file closed, by :meth:`close`, which
+    also runs when the interpreter exits.  The header is written lazily,
+    the first time rows land in an empty file.
+    """
 
-    def __init__(self, csv_path: Path, history_provider) -> None:
+    __slots__ = (
+        "_csv_path", "_batch_size", "_flush_interval",
+        "_file", "_writer", "_pending", "_lock", "_timer",
+    )
+
+    def __init__(
+        self,
+        csv_path: Path,
+        batch_size: int | None = 32,
+        flush_interval: float | None = 0.2,
+    ) -> None:
         """
         Parameters
         ----------
         csv_path :
-            Destination CSV file.
-        history_provider :
-            Callable that returns an iterable of *CalculationMemento* —
-            typically ``calculator.history``.
+            Destination CSV file (created if absent, appended to otherwise).
+        batch_size :
+            Number of pending rows that triggers an immediate write
+            (``None``: never write because of the batch size).
+        flush_interval :
+            Maximum delay, in seconds, before a pending row is written
+            (``None``: no timer).
         """
         self._csv_path = csv_path
-        self._history_provider = history_provider
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
 
         # Ensure directory exists
         csv_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # pandas is imported at top-level; safe in CI.
-    def notify(self, _memento: CalculationMemento) -> None:  # noqa: D401
-        rows = [m.as_dict() for m in self._history_provider()]
-        df = pd.DataFrame(rows)
-        df.to_csv(self._csv_path, index=False)
+        self._file = csv_path.open("a", newline="")
+        self._writer = csv.writer(self._file)
+
+        self._pending: Deque[tuple] = deque()
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+        # Never lose buffered rows on a normal shutdown.
+        atexit.register(self.close)
+
+    def notify(self, memento: CalculationMemento) -> None:  # noqa: D401
+        with self._lock:
+            if self._file.closed:
+                return
+            self._pending.append(memento.as_row())
+            flush_now = self._flush_due(batch=False)
+        if flush_now:
+            self.flush()
+
+    def notify_many(self, mementos: Iterable[CalculationMemento]) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            self._pending.extend(m.as_row() for m in mementos)
+            flush_now = self._flush_due(batch=True)
+        if flush_now:
+            self.flush()
+
+    def _flush_due(self, batch: bool) -> bool:
+        """Return ``True`` if pending rows should be written now.
+
+        Otherwise make sure the flush timer is running.  A *batch* from
+        :meth:`notify_many` is already coalesced, so it is written at once
+        whenever the batch-size trigger is enabled.  Call with the lock held.
+        """
+        if self._batch_size is not None and (
+            batch or len(self._pending) >= self._batch_size
+        ):
+            return True
+        if self._timer is None and self._flush_interval is not None:
+            self._timer = threading.Timer(self._flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+        return False
+
+    def _write_pending(self) -> None:
+        """Stop the timer and write all pending rows.  Call with the lock held."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending or self._file.closed:
+            return
+        if self._file.tell() == 0:
+            self._writer.writerow(CalculationMemento.CSV_HEADER)
+        self._writer.writerows(self._pending)
+        self._pending.clear()
+        self._file.flush()
+
+    def flush(self) -> None:
+        """Write every pending row in a single call and flush the file."""
+        with self._lock:
+            self._write_pending()
+
+    def close(self) -> None:
+        """Flush pending rows, stop the timer and close the file.
+
+        Safe to call more than once; calculations received afterwards are
+        ignored.
+        """
+        with self._lock:
+            if self._file.closed:
+                return
+            self._write_pending()
+            self._file.close()
+        atexit.unregister(self.close)
 
 
 __all__: Sequence[str] = [
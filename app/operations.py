@@ -10,7 +10,9 @@ mandatory arithmetic functions:
 
 Each concrete class is generated dynamically to avoid boilerplate.  A
 convenient `OperationFactory` converts an operation keyword (e.g. ``"add"``)
-and operands into the correct `Operation` instance.
+and operands into the correct `Operation` instance.  Hot paths that only
+need the number can skip the object entirely and call the plain function
+from the `OPS` table (keyword → ``f(a, b)``).
 
 All operations expect **exactly two operands**; validation is performed in the
 base class.  Mathematical error cases (e.g. divide-by-zero) raise
@@ -19,8 +21,11 @@ base class.  Mathematical error cases (e.g. divide-by-zero) raise
 
 from __future__ import annotations
 
+import sys
 from abc import ABC
-from typing import Callable, Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping, Sequence
 
 
 # --------------------------------------------------------------------------- #
@@ -30,18 +35,23 @@ from typing import Callable, Sequence
 class Operation(ABC):
     """Abstract base class for a calculator operation."""
 
+    # Subclasses declare the ``operands`` slot; no per-instance ``__dict__``.
+    __slots__ = ()
+
+    # Every operation is binary; kept as an attribute for introspection only.
+    num_args: int = 2
+
     # These attributes are injected when the concrete subclasses are created.
     name: str                      # short keyword, lowercase
-    num_args: int                  # how many operands are required
     func: Callable[..., float]     # pure function that performs the math
 
     def __init__(self, *operands: float) -> None:
-        if len(operands) != self.num_args:
+        # ``*operands`` is already a tuple, so store it as-is.
+        if len(operands) != 2:
             raise ValueError(
-                f"{self.name} expects {self.num_args} arguments, "
-                f"got {len(operands)}"
+                f"{self.name} expects 2 arguments, got {len(operands)}"
             )
-        self.operands: tuple[float, ...] = tuple(operands)
+        self.operands: tuple[float, ...] = operands
 
     # ------------------------------------------------------------------ #
     # Public API                                                          #
@@ -93,8 +103,9 @@ def _make_op(name: str, fn: Callable[..., float]) -> type[Operation]:
         name,
         (Operation,),
         {
-            "name": name.lower(),
-            "num_args": 2,
+            "__slots__": ("operands",),
+            # interned so lookups with literal keywords hit on identity
+            "name": sys.intern(name.lower()),
             "func": staticmethod(fn),
         },
     )
@@ -113,6 +124,38 @@ Percent    = _make_op("Percent", _percent)
 AbsDiff    = _make_op("AbsDiff", _absdiff)
 
 
+_OPERATION_CLASSES: tuple[type[Operation], ...] = (
+    Add, Subtract, Multiply, Divide, Power, Root,
+    Modulus, IntDivide, Percent, AbsDiff,
+)
+
+
+# --------------------------------------------------------------------------- #
+# Flat function table                                                         #
+# --------------------------------------------------------------------------- #
+
+#: Lower-case keyword → pure two-argument function (read-only).
+OPS: Mapping[str, Callable[[float, float], float]] = MappingProxyType(
+    {cls.name: cls.func for cls in _OPERATION_CLASSES}
+)
+
+
+def resolve_name(op_name: str) -> str:
+    """Return the canonical (lower-case) keyword for *op_name*.
+
+    Callers such as the REPL already pass lower-case keywords, so an exact
+    match is tried first and ``str.lower`` only runs on a miss.  Raises
+    ``ValueError`` listing the valid keywords if the name is unknown.
+    """
+    if op_name in OPS:
+        return op_name
+    name = op_name.lower()
+    if name not in OPS:
+        valid = ", ".join(sorted(OPS))
+        raise ValueError(f"Unknown operation '{op_name}'. Valid options: {valid}")
+    return name
+
+
 # --------------------------------------------------------------------------- #
 # Operation factory                                                           #
 # --------------------------------------------------------------------------- #
@@ -120,24 +163,22 @@ AbsDiff    = _make_op("AbsDiff", _absdiff)
 class OperationFactory:
     """Create an Operation instance from a keyword and operand list."""
 
-    _registry: dict[str, type[Operation]] = {
-        cls.name: cls
-        for cls in (
-            Add, Subtract, Multiply, Divide, Power, Root,
-            Modulus, IntDivide, Percent, AbsDiff,
-        )
-    }
+    _registry: Mapping[str, type[Operation]] = MappingProxyType(
+        {cls.name: cls for cls in _OPERATION_CLASSES}
+    )
 
     @classmethod
     def create(cls, op_name: str, *operands: float) -> Operation:
-        try:
-            op_cls = cls._registry[op_name.lower()]
-        except KeyError as exc:
-            valid = ", ".join(sorted(cls._registry))
-            raise ValueError(
-                f"Unknown operation '{op_name}'. Valid options: {valid}"
-            ) from exc
-        return op_cls(*operands)
+        return _resolve(op_name)(*operands)
+
+
+@lru_cache(maxsize=32)
+def _resolve(op_name: str) -> type[Operation]:
+    """Cached keyword → class lookup; repeat names skip normalisation.
+
+    Unknown names raise and are therefore never cached.
+    """
+    return OperationFactory._registry[resolve_name(op_name)]
 
 
 # --------------------------------------------------------------------------- #
@@ -149,4 +190,5 @@ __all__: Sequence[str] = [
     "Add", "Subtract", "Multiply", "Divide",
     "Power", "Root", "Modulus", "IntDivide", "Percent", "AbsDiff",
     "OperationFactory",
+    "OPS", "resolve_name",
 ]
@@ -0,0 +1,31 @@
+"""
+conftest.py
+===========
+
+Shared pytest fixtures.
+
+Every test owns its state (fresh Calculator / CLI, per-test ``tmp_path``),
+and the session runs inside a private working directory, so the suite is
+safe to run in parallel with ``pytest -n auto`` (pytest-xdist).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.calculator import Calculator
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _isolated_cwd(tmp_path_factory):
+    """Run the session in a temp dir so CalculatorCLI's default ``logs/`` and
+    ``history/`` files never land in the repo or collide across workers."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("cwd"))
+        yield
+
+
+@pytest.fixture
+def new_calc() -> Calculator:
+    """A fresh calculator with no observers (default history bound)."""
+    return Calculator(max_history=None)
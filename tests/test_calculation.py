@@ -0,0 +1,56 @@
+"""
+test_calculation.py
+===================
+
+Checks that :class:`app.calculation.CalculationMemento` behaves like a plain
+value object: its cached CSV row survives copying and pickling, and the
+dict / row helpers agree with the fields.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+from app.calculation import CalculationMemento
+from app.operations import OperationFactory
+
+
+def test_fresh_memento_round_trips_through_pickle_and_copy() -> None:
+    m = CalculationMemento("add", (2.0, 3.0), 5.0)
+
+    for clone in (
+        pickle.loads(pickle.dumps(m)),
+        copy.copy(m),
+        copy.deepcopy(m),
+    ):
+        assert clone == m
+        assert clone.as_row() == m.as_row()
+
+    # the cached row is a (documented) private field of its own
+    assert dataclasses.astuple(m) == ("add", (2.0, 3.0), 5.0, m.timestamp, m.as_row())
+
+
+def test_as_dict_matches_csv_header() -> None:
+    m = CalculationMemento("divide", (9.0, 4.0), 2.25, "2025-06-28T07:03:48+00:00")
+
+    assert m.as_dict() == {
+        "timestamp": "2025-06-28T07:03:48+00:00",
+        "operation": "divide",
+        "op1": 9.0,
+        "op2": 4.0,
+        "result": 2.25,
+    }
+    assert tuple(m.as_dict()) == CalculationMemento.CSV_HEADER
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        m.result = 0  # type: ignore[misc]
+
+
+def test_from_operation_records_the_operation() -> None:
+    op = OperationFactory.create("power", 2, 3)
+    m = CalculationMemento.from_operation(op)
+
+    assert (m.operation_name, m.operands, m.result) == ("power", (2, 3), 8)
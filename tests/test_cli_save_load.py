@@ -35,3 +35,82 @@ def test_save_then_load_history(tmp_path: Path) -> None:
     assert len(hist) == 2
     assert hist[0].result == 5
     assert hist[1].result == 8
+
+
+def test_save_command_keeps_quoted_path_verbatim(tmp_path: Path) -> None:
+    """`save` keeps spaces and case in a quoted file name."""
+    cli = CalculatorCLI()
+    cli.calc.evaluate("add", 1, 2)
+
+    dest = tmp_path / "My History.csv"
+    cli._handle_line(f'SAVE "{dest}"')  # type: ignore[attr-defined]
+    assert dest.exists()
+
+
+def test_load_accepts_quoted_csv(tmp_path: Path) -> None:
+    """Files with quoted fields (e.g. from a spreadsheet) still load."""
+    src = tmp_path / "quoted.csv"
+    src.write_text(
+        '"timestamp","operation","op1","op2","result"\r\n'
+        '"2025-06-28T07:03:48+00:00","ADD","2.0","5.0","7.0"\r\n',
+        encoding="utf-8",
+    )
+    cli = CalculatorCLI()
+    cli._cmd_load([str(src)])  # type: ignore[attr-defined]
+
+    (m,) = cli.calc.history()
+    assert (m.operation_name, m.operands, m.result) == ("add", (2.0, 5.0), 7.0)
+
+
+def test_save_quotes_fields_that_need_it(tmp_path: Path) -> None:
+    """A loaded timestamp containing a comma survives save ➜ load."""
+    src = tmp_path / "quoted.csv"
+    src.write_text(
+        "timestamp,operation,op1,op2,result\n"
+        '"Jun 28, 2025","add","2","5","7"\n',
+        encoding="utf-8",
+    )
+    cli = CalculatorCLI()
+    cli._cmd_load([str(src)])  # type: ignore[attr-defined]
+
+    out = tmp_path / "out.csv"
+    cli._cmd_save([str(out)])  # type: ignore[attr-defined]
+    assert out.read_bytes().splitlines(keepends=True)[-1].endswith(b'7.0\n')
+    assert b"\r" not in out.read_bytes()  # same line endings as the fast path
+    cli._cmd_load([str(out)])  # type: ignore[attr-defined]
+
+    (m,) = cli.calc.history()
+    assert (m.timestamp, m.operation_name, m.result) == ("Jun 28, 2025", "add", 7.0)
+
+
+def test_load_maps_columns_by_header_name(tmp_path: Path) -> None:
+    """Columns in a different order are matched by name, not position."""
+    src = tmp_path / "reordered.csv"
+    src.write_text(
+        "operation,timestamp,op1,op2,result\n"
+        "add,2025-06-28T07:03:48+00:00,2,5,7\n",
+        encoding="utf-8",
+    )
+    cli = CalculatorCLI()
+    cli._cmd_load([str(src)])  # type: ignore[attr-defined]
+
+    (m,) = cli.calc.history()
+    assert (m.timestamp, m.operation_name) == ("2025-06-28T07:03:48+00:00", "add")
+    assert (m.operands, m.result) == ((2.0, 5.0), 7.0)
+
+
+def test_load_bad_row_keeps_current_history(tmp_path: Path, capsys) -> None:
+    """A row that fails to parse aborts the load before history is cleared."""
+    src = tmp_path / "broken.csv"
+    src.write_text(
+        "timestamp,operation,op1,op2,result\n"
+        "2025-06-28T07:03:48+00:00,add,2,5,7\n"
+        "2025-06-28T07:03:49+00:00,add,two,5,7\n",
+        encoding="utf-8",
+    )
+    cli = CalculatorCLI()
+    cli.calc.evaluate("add", 1, 1)
+    cli._cmd_load([str(src)])  # type: ignore[attr-defined]
+
+    assert "cannot load" in capsys.readouterr().out
+    assert [m.result for m in cli.calc.history()] == [2]
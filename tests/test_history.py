@@ -9,38 +9,39 @@ Scenarios covered
 * Normal push / undo / redo flow.
 * Multiple undos / redos in sequence.
 * Edge-cases: undo / redo on empty stack, clear_history().
+* The ring buffer itself: bounded wrap-around, unbounded growth, max_size checks.
 """
 
 from __future__ import annotations
 
 import math
+from datetime import datetime, timedelta
+
 import pytest
 
 from app.calculator import Calculator
 from app.calculation import CalculationMemento
-
-
-def _new_calc() -> Calculator:
-    """Utility: create a calculator with unlimited history for the tests."""
-    return Calculator(max_history=None)
+from app.history import History
 
 
 # --------------------------------------------------------------------------- #
 # Happy-path                                                                   #
 # --------------------------------------------------------------------------- #
 
-def test_push_and_undo_redo() -> None:
-    calc = _new_calc()
+def test_push_and_undo_redo(new_calc: Calculator) -> None:
+    calc = new_calc
 
     # push two operations
     assert math.isclose(calc.evaluate("add", 2, 3), 5)
     assert math.isclose(calc.evaluate("multiply", 4, 2), 8)
     assert len(calc) == 2
+    assert [m.result for m in calc.iter_history()] == [5, 8]
 
     # undo last op
     last = calc.undo()
     assert isinstance(last, CalculationMemento)
     assert last.result == 8
+    assert datetime.fromisoformat(last.timestamp).utcoffset() == timedelta(0)
     assert len(calc) == 1
 
     # redo brings it back
@@ -53,9 +54,9 @@ def test_push_and_undo_redo() -> None:
 # Multi-step undo / redo                                                      #
 # --------------------------------------------------------------------------- #
 
-def test_multi_level_undo_redo() -> None:
-    calc = _new_calc()
-    results = [calc.evaluate("add", i, i) for i in range(3)]  # 0+0, 1+1, 2+2
+def test_multi_level_undo_redo(new_calc: Calculator) -> None:
+    calc = new_calc
+    results = calc.evaluate_many([("add", i, i) for i in range(3)])  # 0+0, 1+1, 2+2
     assert results == [0, 2, 4]
     assert len(calc) == 3
 
@@ -69,18 +70,41 @@ def test_multi_level_undo_redo() -> None:
     calc.redo()
     assert len(calc) == 3
     # latest result back on top
-    assert calc.history()[-1].result == 4
+    assert calc.peek().result == 4
+
+
+def test_evaluate_many_is_all_or_nothing(new_calc: Calculator) -> None:
+    calc = new_calc
+    with pytest.raises(ValueError):
+        calc.evaluate_many([("add", 1, 1), ("divide", 1, 0)])
+    assert len(calc) == 0
+
+    assert calc.evaluate_many([("ADD", 1, 1), ("divide", 9, 3)]) == [2, 3]
+    assert [m.operation_name for m in calc.history()] == ["add", "divide"]
+
+
+def test_history_view_is_live_but_tuple_is_a_snapshot(new_calc: Calculator) -> None:
+    calc = new_calc
+    calc.evaluate("add", 1, 1)
+
+    view, snap = calc.history(), calc.history_tuple()
+    calc.evaluate("add", 2, 2)
+
+    assert [m.result for m in view] == [2, 4]
+    assert [m.result for m in snap] == [2]
 
 
 # --------------------------------------------------------------------------- #
 # Edge cases                                                                   #
 # --------------------------------------------------------------------------- #
 
-def test_undo_redo_empty_stack() -> None:
-    calc = _new_calc()
+def test_undo_redo_empty_stack(new_calc: Calculator) -> None:
+    calc = new_calc
 
     with pytest.raises(IndexError):
         calc.undo()
+    with pytest.raises(IndexError):
+        calc.peek()
 
     # After one calculate + undo, redo is allowed once, then fails.
     calc.evaluate("power", 2, 3)
@@ -90,8 +114,8 @@ def test_undo_redo_empty_stack() -> None:
         calc.redo()
 
 
-def test_clear_history() -> None:
-    calc = _new_calc()
+def test_clear_history(new_calc: Calculator) -> None:
+    calc = new_calc
     calc.evaluate("add", 1, 1)
     calc.evaluate("subtract", 10, 4)
 
@@ -100,3 +124,53 @@ def test_clear_history() -> None:
 
     with pytest.raises(IndexError):
         calc.undo()
+
+
+def test_evaluate_rejects_unknown_op_and_wrong_arity(new_calc: Calculator) -> None:
+    calc = new_calc
+
+    with pytest.raises(ValueError, match="Unknown operation"):
+        calc.evaluate("nonexistent", 1, 2)
+    with pytest.raises(ValueError, match="expects 2 arguments"):
+        calc.evaluate("add", 1)
+    assert len(calc) == 0
+
+
+def test_bounded_history_wraps_and_drops_oldest() -> None:
+    hist: History[int] = History(max_size=3)
+    for i in range(5):
+        hist.push(i)
+    assert list(hist.past_view()) == [2, 3, 4]
+
+    assert hist.undo() == 4
+    hist.push(5)                       # discards the redo entry
+    assert list(hist.past_view()) == [2, 3, 5]
+    assert hist.past_view()[-1] == 5
+    with pytest.raises(IndexError):
+        hist.redo()
+
+
+def test_unbounded_history_grows_and_keeps_redo_semantics() -> None:
+    hist: History[int] = History(max_size=None)
+    assert list(hist.past_view()) == []
+    for i in range(4):
+        hist.push(i)
+    assert list(hist.past_view()) == [0, 1, 2, 3]
+
+    assert (hist.undo(), hist.undo()) == (3, 2)
+    assert list(hist.past_view()) == [0, 1]
+    assert list(hist.future_view()) == [2, 3]
+
+    hist.push(9)                       # overwrites the first stale redo slot
+    assert list(hist.future_view()) == []
+    hist.push(10)                      # reuses the second one
+    hist.push(11)                      # then appends again
+    assert list(hist.past_view()) == [0, 1, 9, 10, 11]
+    assert hist.past_view()[1:3] == [1, 9]
+    with pytest.raises(IndexError):
+        hist.past_view()[5]
+
+
+def test_history_rejects_non_positive_max_size() -> None:
+    with pytest.raises(ValueError, match="max_size"):
+        History(max_size=0)
@@ -0,0 +1,34 @@
+"""
+test_history_soa.py
+===================
+
+Checks that :class:`app.history_soa.HistorySoA` stores calculator history
+column by column and hands back the same mementos it was given.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from app.calculator import Calculator
+from app.calculation import CalculationMemento
+from app.history_soa import HistorySoA
+
+
+def test_soa_history_round_trips_mementos(new_calc: Calculator) -> None:
+    calc = new_calc
+    calc.evaluate("add", 2, 3)
+    calc.evaluate("divide", 9, 4)
+
+    soa = HistorySoA(calc.history())
+    assert len(soa) == 2
+    assert sum(soa.results) == 7.25
+    assert soa[-1] == calc.history()[-1]
+    assert soa[0:2] == list(calc.history())
+    assert soa[::-1][0] == soa[-1]
+    assert list(soa) == list(calc.history())
+
+    with pytest.raises(ValueError):
+        soa.push(CalculationMemento("nonexistent", (1, 2), 3))
+    soa.clear()
+    assert len(soa) == 0
@@ -11,16 +11,22 @@ from __future__ import annotations
 from app.calculator import Calculator
 
 
-def test_observers_not_called_on_error() -> None:
-    calc = Calculator()
-    called = False
+class SpyObserver:
+    """Records whether it was notified."""
 
-    class SpyObserver:
-        def notify(self, _memento):  # noqa: D401
-            nonlocal called
-            called = True
+    __slots__ = ("called",)
 
-    calc.register_observer(SpyObserver())
+    def __init__(self) -> None:
+        self.called = False
+
+    def notify(self, _memento) -> None:  # noqa: D401
+        self.called = True
+
+
+def test_observers_not_called_on_error(new_calc: Calculator) -> None:
+    calc = new_calc
+    spy = SpyObserver()
+    calc.register_observer(spy)
 
     # Trigger a division-by-zero ValueError
     try:
@@ -28,4 +34,4 @@ def test_observers_not_called_on_error() -> None:
     except ValueError:
         pass
 
-    assert called is False, "Observer should not fire on failed evaluation"
+    assert spy.called is False, "Observer should not fire on failed evaluation"
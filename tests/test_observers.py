@@ -14,36 +14,37 @@ from __future__ import annotations
 import csv
 from pathlib import Path
 
-import pandas as pd
 import pytest
 
+from app import observers
+from app.calculation import CalculationMemento
 from app.calculator import Calculator
-from app.observers import AutoSaveObserver, LoggingObserver
+from app.observers import AutoSaveObserver, LoggingObserver, Observer
 
 
 # --------------------------------------------------------------------------- #
 # Helper                                                                      #
 # --------------------------------------------------------------------------- #
 
-def _setup_calc(tmp_path: Path):
-    """Return a calculator wired with both observers and ready for testing."""
-    calc = Calculator(max_history=None)
-
+def _setup_calc(calc: Calculator, tmp_path: Path):
+    """Wire both observers into *calc* and return it with their targets."""
     log_file = tmp_path / "calc.log"
     csv_file = tmp_path / "history.csv"
 
     calc.register_observer(LoggingObserver(log_file))
-    calc.register_observer(AutoSaveObserver(csv_file, calc.history))
-    return calc, log_file, csv_file
+    # manual flushing: no timer threads, tests decide when rows are written
+    autosave = AutoSaveObserver(csv_file, batch_size=None, flush_interval=None)
+    calc.register_observer(autosave)
+    return calc, log_file, csv_file, autosave
 
 
 # --------------------------------------------------------------------------- #
 # Tests                                                                       #
 # --------------------------------------------------------------------------- #
 
-def test_logging_observer_writes_line(tmp_path: Path) -> None:
+def test_logging_observer_writes_line(new_calc: Calculator, tmp_path: Path) -> None:
     """Ensure each evaluation appends a human-readable line to the log file."""
-    calc, log_file, _ = _setup_calc(tmp_path)
+    calc, log_file, _csv_file, _autosave = _setup_calc(new_calc, tmp_path)
 
     calc.evaluate("add", 2, 3)   # 2 + 3 = 5
     calc.evaluate("multiply", 2, 4)  # 2 × 4 = 8
@@ -53,27 +54,176 @@ def test_logging_observer_writes_line(tmp_path: Path) -> None:
     assert "MULTIPLY 2, 4 = 8" in contents
 
 
-def test_autosave_observer_writes_csv(tmp_path: Path) -> None:
-    """CSV file is overwritten after each calculation with full history."""
-    calc, _log_file, csv_file = _setup_calc(tmp_path)
+def test_autosave_observer_writes_csv(new_calc: Calculator, tmp_path: Path) -> None:
+    """Each calculation appends exactly one row to the CSV file."""
+    calc, _log_file, csv_file, autosave = _setup_calc(new_calc, tmp_path)
 
     calc.evaluate("power", 2, 3)   # 8
     calc.evaluate("subtract", 10, 4)  # 6
+    assert not csv_file.read_text()   # nothing written until flushed
+    autosave.flush()
+
+    with csv_file.open(newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 2
+    assert [float(r["result"]) for r in rows] == [8, 6]
+
+
+def test_autosave_observer_flushes_full_batch(new_calc: Calculator, tmp_path: Path) -> None:
+    """Reaching *batch_size* pending rows writes them without an explicit flush."""
+    calc = new_calc
+    csv_file = tmp_path / "history.csv"
+    calc.register_observer(AutoSaveObserver(csv_file, batch_size=2, flush_interval=None))
+
+    calc.evaluate("add", 1, 1)
+    assert not csv_file.read_text()  # still buffered
+    calc.evaluate("add", 2, 2)
+
+    with csv_file.open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == ["timestamp", "operation", "op1", "op2", "result"]
+    assert [r[-1] for r in rows[1:]] == ["2", "4"]
+
+
+def test_notify_many_batches_per_observer(new_calc: Calculator, tmp_path: Path) -> None:
+    """A batch reaches bulk-aware observers once and plain ones per memento."""
+    calc = new_calc
+    csv_file = tmp_path / "history.csv"
+    calc.register_observer(AutoSaveObserver(csv_file))
+
+    seen = []
+
+    class PlainObserver:
+        def notify(self, memento):  # noqa: D401
+            seen.append(memento)
+
+    calc.register_observer(PlainObserver())
+
+    batch = [CalculationMemento("add", (i, i), i + i) for i in range(3)]
+    calc._notify_many(batch)  # type: ignore[attr-defined]
+
+    assert seen == batch
+    with csv_file.open(newline="") as f:
+        assert len(list(csv.reader(f))) == 1 + len(batch)  # flushed at once
+
+
+def test_default_notify_many_loops_over_notify(new_calc: Calculator) -> None:
+    """An Observer subclass that only implements notify still gets batches."""
+    calc = new_calc
+    seen = []
+
+    class RecordingObserver(Observer):
+        def notify(self, memento):  # noqa: D401
+            seen.append(memento)
+
+    calc.register_observer(RecordingObserver())
+    batch = [CalculationMemento("add", (i, i), i + i) for i in range(3)]
+    calc._notify_many(batch)  # type: ignore[attr-defined]
+
+    assert seen == batch
+
+
+class _FakeTimer:
+    """Stand-in for ``threading.Timer`` that only fires when told to."""
+
+    started: list["_FakeTimer"] = []
+
+    def __init__(self, interval, function):
+        self.interval, self.function = interval, function
+        self.daemon = False
+
+    def start(self):
+        _FakeTimer.started.append(self)
+
+    def cancel(self):
+        pass
+
+
+def test_notify_many_starts_timer_without_batch_size(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """With only the time trigger enabled, a batch is written by the timer."""
+    monkeypatch.setattr(_FakeTimer, "started", [])
+    monkeypatch.setattr(observers.threading, "Timer", _FakeTimer)
+    csv_file = tmp_path / "history.csv"
+    autosave = AutoSaveObserver(csv_file, batch_size=None, flush_interval=0.05)
+    autosave.notify_many([CalculationMemento("add", (1, 2), 3)])
+
+    (timer,) = _FakeTimer.started
+    assert timer.interval == 0.05
+    assert not csv_file.read_text()  # waits for the timer
+    timer.function()
+    with csv_file.open(newline="") as f:
+        assert len(list(csv.reader(f))) == 2  # header + row
+    autosave.close()
+
+
+def test_logging_observer_close_releases_file(tmp_path: Path) -> None:
+    """close() closes the log once; later calculations are not written."""
+    log_file = tmp_path / "calc.log"
+    logger = LoggingObserver(log_file)
+    logger.notify(CalculationMemento("add", (1, 2), 3))
+
+    logger.close()
+    logger.close()  # idempotent
+    logger.notify(CalculationMemento("add", (2, 2), 4))
+
+    assert logger._file.closed  # type: ignore[attr-defined]
+    assert log_file.read_text().count("\n") == 1
+
+
+def test_autosave_close_flushes_and_closes(tmp_path: Path) -> None:
+    """close() writes pending rows, stops the timer and releases the file."""
+    csv_file = tmp_path / "history.csv"
+    autosave = AutoSaveObserver(csv_file, batch_size=None, flush_interval=60)
+    autosave.notify(CalculationMemento("add", (1, 2), 3))
+
+    autosave.close()
+    autosave.close()  # idempotent
+
+    assert autosave._timer is None  # type: ignore[attr-defined]
+    assert autosave._file.closed  # type: ignore[attr-defined]
+    with csv_file.open(newline="") as f:
+        assert len(list(csv.reader(f))) == 2  # header + row
+
+
+def test_autosave_ignores_calculations_after_close(tmp_path: Path) -> None:
+    """A closed observer drops new rows and never starts a timer."""
+    csv_file = tmp_path / "history.csv"
+    autosave = AutoSaveObserver(csv_file, batch_size=1, flush_interval=60)
+    autosave.close()
+
+    autosave.notify(CalculationMemento("add", (1, 2), 3))
+    autosave.notify_many([CalculationMemento("add", (2, 2), 4)])
+    autosave.flush()
+
+    assert autosave._timer is None  # type: ignore[attr-defined]
+    assert not csv_file.read_text()
+
+
+def test_autosave_appends_to_existing_file_without_new_header(tmp_path: Path) -> None:
+    """A second observer on the same file adds rows but no second header."""
+    csv_file = tmp_path / "history.csv"
+    for result in (3, 4):
+        autosave = AutoSaveObserver(csv_file, batch_size=None, flush_interval=None)
+        autosave.flush()  # nothing pending: a no-op
+        autosave.notify(CalculationMemento("add", (1, result - 1), result))
+        autosave.close()
 
-    # pandas reads our CSV back
-    df = pd.read_csv(csv_file)
-    assert len(df) == 2
-    assert list(df["result"]) == [8, 6]
+    with csv_file.open(newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == list(CalculationMemento.CSV_HEADER)
+    assert [r[-1] for r in rows[1:]] == ["3", "4"]
 
 
-def test_observer_error_does_not_break_evaluate(tmp_path: Path) -> None:
+def test_observer_error_does_not_break_evaluate(new_calc: Calculator, tmp_path: Path) -> None:
     """A failing observer should not crash the Calculator."""
 
     class BadObserver:
         def notify(self, _memento):  # noqa: D401
             raise RuntimeError("observer blew up")
 
-    calc, _log_file, _csv_file = _setup_calc(tmp_path)
+    calc, _log_file, _csv_file, _autosave = _setup_calc(new_calc, tmp_path)
     calc.register_observer(BadObserver())  # intentionally bad
 
     # evaluate returns correct result despite observer failure
@@ -5,7 +5,6 @@ Parametrised tests for every concrete Operation class and the OperationFactory.
 
 from __future__ import annotations
 
-import math
 import pytest
 
 import app.operations as ops
@@ -23,7 +22,7 @@ import app.operations as ops
         (ops.Multiply,   (3, 4),     12),
         (ops.Divide,     (9, 3),     3),
         (ops.Power,      (2, 3),     8),
-        (ops.Root,       (27, 3),    3),
+        (ops.Root,       (27, 3),    pytest.approx(3)),  # 3.0000000000000004
         (ops.Modulus,    (10, 4),    2),
         (ops.IntDivide,  (10, 4),    2),
         (ops.Percent,    (25, 200),  12.5),
@@ -31,42 +30,27 @@ import app.operations as ops
     ],
 )
 def test_operation_evaluate(op_cls, operands, expected) -> None:
-    op = op_cls(*operands)
-    assert math.isclose(op.evaluate(), expected, rel_tol=1e-9)
+    # exact cases compare with ==; inexact ones carry pytest.approx above
+    assert op_cls(*operands).evaluate() == expected
 
 
 # -------------------------------------------------------------------- #
 # Argument-count validation                                             #
 # -------------------------------------------------------------------- #
 
-@pytest.mark.parametrize("op_cls", [
+_ALL_OPS = (
     ops.Add, ops.Subtract, ops.Multiply, ops.Divide, ops.Power, ops.Root,
     ops.Modulus, ops.IntDivide, ops.Percent, ops.AbsDiff,
-])
-def test_wrong_arity(op_cls) -> None:
-    with pytest.raises(ValueError):
-        op_cls(1)              # too few
-    with pytest.raises(ValueError):
-        op_cls(1, 2, 3)        # too many
+)
 
 
-# -------------------------------------------------------------------- #
-# Error cases (÷0 etc.)                                                 #
-# -------------------------------------------------------------------- #
-
-@pytest.mark.parametrize(
-    "op_cls, operands",
-    [
-        (ops.Divide,    (5, 0)),
-        (ops.Modulus,   (5, 0)),
-        (ops.IntDivide, (5, 0)),
-        (ops.Percent,   (5, 0)),
-        (ops.Root,      (8, 0)),
-    ],
-)
-def test_invalid_math(op_cls, operands) -> None:
-    with pytest.raises(ValueError):
-        op_cls(*operands).evaluate()
+def test_wrong_arity() -> None:
+    for op_cls in _ALL_OPS:
+        expected = f"{op_cls.name} expects 2 arguments"
+        with pytest.raises(ValueError, match=expected):
+            op_cls(1)              # too few
+        with pytest.raises(ValueError, match=expected):
+            op_cls(1, 2, 3)        # too many
 
 
 # -------------------------------------------------------------------- #
@@ -79,10 +63,24 @@ def test_factory_valid() -> None:
     assert op.evaluate() == 5
 
 
+def test_factory_is_case_insensitive() -> None:
+    assert ops.resolve_name("add") == ops.resolve_name("ADD") == "add"
+    assert isinstance(ops.OperationFactory.create("Add", 2, 3), ops.Add)
+
+
 def test_factory_invalid() -> None:
     with pytest.raises(ValueError):
         ops.OperationFactory.create("nonexistent", 1, 2)
 
+
+def test_ops_table_matches_classes() -> None:
+    """The flat function table computes the same results as the classes."""
+    assert set(ops.OPS) == set(ops.OperationFactory._registry)
+    with pytest.raises(TypeError):
+        ops.OPS["noop"] = lambda a, b: a  # type: ignore[index]
+    for name, fn in ops.OPS.items():
+        assert fn(9, 4) == ops.OperationFactory.create(name, 9, 4).evaluate()
+
 # -------------------------------------------------------------------- #
 # Error-handling: divide / modulo / root by zero                       #
 # -------------------------------------------------------------------- #
@@ -90,16 +88,21 @@ def test_factory_invalid() -> None:
 from app.operations import OperationFactory
 
 @pytest.mark.parametrize(
-    "op_name, a, b",
+    "op_name, op_cls, a, b",
     [
-        ("divide",    5, 0),
-        ("modulus",   5, 0),
-        ("intdivide", 5, 0),
-        ("percent",   5, 0),
-        ("root",      8, 0),
+        ("divide",    ops.Divide,    5, 0),
+        ("modulus",   ops.Modulus,   5, 0),
+        ("intdivide", ops.IntDivide, 5, 0),
+        ("percent",   ops.Percent,   5, 0),
+        ("root",      ops.Root,      8, 0),
     ],
 )
-def test_zero_division_family(op_name, a, b) -> None:
-    """Every op that relies on a non-zero denominator should raise."""
+def test_zero_division_family(op_name, op_cls, a, b) -> None:
+    """Every op that relies on a non-zero denominator should raise.
+
+    Covers both entry points: the factory and the concrete class.
+    """
     with pytest.raises(ValueError):
         OperationFactory.create(op_name, a, b).evaluate()
+    with pytest.raises(ValueError):
+        op_cls(a, b).evaluate()
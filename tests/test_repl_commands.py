@@ -8,53 +8,77 @@ coverage without interactive input.
 
 from __future__ import annotations
 
+import io
 import re
-from pathlib import Path
+from contextlib import redirect_stdout
 
 import pytest
 from app.calculator_repl import CalculatorCLI
 
+# Case-insensitive, and colour codes never split the phrase, so the raw
+# output can be searched without lowering or stripping it first.
+_DIV0_RE = re.compile(
+    r"dividing by zero is not allowed|division by zero", re.IGNORECASE
+)
 
-def _new_cli(tmp_path: Path) -> CalculatorCLI:
+
+def _new_cli(monkeypatch: pytest.MonkeyPatch) -> CalculatorCLI:
     """Create CLI with observers disabled (to avoid file writes)."""
     cli = CalculatorCLI()
-    cli.calc._observers.clear()          # type: ignore[attr-defined]
-    cli._cmd_save = lambda *_a, **_kw: None  # type: ignore[attr-defined]
-    cli._cmd_load = lambda *_a, **_kw: None  # type: ignore[attr-defined]
+    monkeypatch.setattr(cli.calc, "_observers", ())
+    monkeypatch.setattr(cli, "_cmd_save", lambda *_a, **_kw: None)
+    monkeypatch.setattr(cli, "_cmd_load", lambda *_a, **_kw: None)
     return cli
 
 
-def test_basic_calculations_and_history(capsys, tmp_path):
-    cli = _new_cli(tmp_path)
+def _run(cli: CalculatorCLI, *lines: str) -> str:
+    """Feed *lines* to the CLI as one batch and return what it printed.
+
+    ``print`` only goes through ``sys.stdout``, so swapping it for a
+    StringIO is enough — no fd-level capture needed.
+    """
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        cli._handle_lines(lines)
+    return buf.getvalue()
 
-    cli._handle_line("add 2 3")
-    cli._handle_line("power 2 5")
-    cli._handle_line("history")
 
-    out = capsys.readouterr().out
+def test_basic_calculations_and_history(monkeypatch):
+    cli = _new_cli(monkeypatch)
+
+    out = _run(cli, "add 2 3", "power 2 5", "history")
     assert "= 5" in out and "= 32" in out
     assert "ADD" in out and "POWER" in out
 
 
+@pytest.fixture(scope="module")
+def shared_cli():
+    """One CLI reused by cases that only need an empty calculator."""
+    with pytest.MonkeyPatch.context() as mp:
+        yield _new_cli(mp)
+
+
 @pytest.mark.parametrize("cmd", ["undo", "redo", "clear", "help"])
-def test_single_word_commands(cmd, capsys, tmp_path):
-    cli = _new_cli(tmp_path)
-    cli._handle_line(cmd)
-    out = capsys.readouterr().out
+def test_single_word_commands(cmd, shared_cli):
+    shared_cli.calc.clear_history()  # isolate cases from each other
+    out = _run(shared_cli, cmd)
     # A simple sanity check that the command produced some output
     assert out.strip() != ""
 
 
-def test_friendly_error_message(capsys, tmp_path):
-    cli = _new_cli(tmp_path)
-    cli._handle_line("divide 5 0")
-    out = capsys.readouterr().out
-
-    import re
-    clean = re.sub(r"\x1b\[[0-9;]*m", "", out.lower())  # strip colour codes
+def test_friendly_error_message(monkeypatch):
+    cli = _new_cli(monkeypatch)
+    out = _run(cli, "divide 5 0")
 
     # Accept either phrase so CI and local both pass
-    assert (
-        "dividing by zero is not allowed" in clean
-        or "division by zero" in clean
-    ), f"Unexpected message: {clean}"
+    assert _DIV0_RE.search(out), f"Unexpected message: {out!r}"
+
+
+def test_batch_output_survives_exit(monkeypatch):
+    cli = _new_cli(monkeypatch)
+    buf = io.StringIO()
+    with redirect_stdout(buf), pytest.raises(SystemExit):
+        cli._handle_lines(["add 1 1", "exit", "add 2 2"])
+    out = buf.getvalue()
+    assert "= 2" in out and "Goodbye!" in out
+    assert "= 4" not in out